@@ -2,6 +2,45 @@ import pandas as pd
 import re
 
 
+PARTY_ALIASES = {
+    "Independent, close to democrat": "Independent, near democrat",
+    "Independent, close to republican": "Independent, near republican",
+    "Independent (neither, no response)": "Independent",
+}
+
+PARTY_ORDER = [
+    "Strong democrat",
+    "Not very strong democrat",
+    "Independent, near democrat",
+    "Independent",
+    "Independent, near republican",
+    "Not very strong republican",
+    "Strong republican",
+    "Other",
+]
+
+PARTY_COLORS = {
+    "Strong republican": "#8B0000",
+    "Not very strong republican": "#D33B3B",
+    "Strong democrat": "#0B3D91",
+    "Not very strong democrat": "#2E6FD8",
+    "Independent, near republican": "#F7DADA",
+    "Independent, near democrat": "#DCEBFF",
+    "Independent": "#BDBDBD",
+    "Other": "#D2B48C",
+}
+
+PERIOD_MAP = {
+    2010: "Pre-Trump",
+    2012: "Pre-Trump",
+    2014: "Pre-Trump",
+    2018: "Post-Trump",
+    2022: "Post-Trump",
+    2024: "Post-Trump",
+}
+PERIODS = ["Pre-Trump", "Post-Trump"]
+
+
 def is_invalid_cell(value) -> bool:
     if pd.isna(value):
         return True
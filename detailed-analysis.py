@@ -4,100 +4,52 @@ import math
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from data import PARTY_ALIASES, PARTY_COLORS, PARTY_ORDER, PERIOD_MAP, PERIODS
+from report import GroupSummary, PopulationThreshold, Report, TTestResult, ThresholdCount
+
 try:
     from scipy import stats
 except ImportError:  # pragma: no cover - optional dependency for t-tests
     stats = None
 
 
-def summarize(series: pd.Series) -> dict:
-    return {
-        "count": int(series.count()),
-        "mean": series.mean(),
-        "median": series.median(),
-        "std": series.std(),
-        "min": series.min(),
-        "25%": series.quantile(0.25),
-        "75%": series.quantile(0.75),
-        "max": series.max(),
-    }
-
-
 def main() -> None:
     df = pd.read_excel("clean-data.xlsx")
     df["wordsum"] = pd.to_numeric(df["wordsum"], errors="coerce")
-    party_aliases = {
-        "Independent, close to democrat": "Independent, near democrat",
-        "Independent, close to republican": "Independent, near republican",
-        "Independent (neither, no response)": "Independent",
-    }
-    df["partyid"] = df["partyid"].replace(party_aliases)
-
-    party_order = [
-        "Strong democrat",
-        "Not very strong democrat",
-        "Independent, near democrat",
-        "Independent",
-        "Independent, near republican",
-        "Not very strong republican",
-        "Strong republican",
-        "Other",
-    ]
-    party_colors = {
-        "Strong republican": "#8B0000",
-        "Not very strong republican": "#D33B3B",
-        "Strong democrat": "#0B3D91",
-        "Not very strong democrat": "#2E6FD8",
-        "Independent, near republican": "#F7DADA",
-        "Independent, near democrat": "#DCEBFF",
-        "Independent": "#BDBDBD",
-        "Other": "#D2B48C",
-    }
-
-    period_map = {
-        2010: "Pre-Trump",
-        2012: "Pre-Trump",
-        2014: "Pre-Trump",
-        2018: "Post-Trump",
-        2022: "Post-Trump",
-        2024: "Post-Trump",
-    }
-    df["period"] = df["year"].map(period_map)
-    periods = ["Pre-Trump", "Post-Trump"]
+    report = Report("wordsum-detailed")
+    df["partyid"] = df["partyid"].replace(PARTY_ALIASES)
+
+    df["period"] = df["year"].map(PERIOD_MAP)
 
     parties = df["partyid"].dropna().astype(str).unique().tolist()
-    ordered_parties = [p for p in party_order if p in parties]
-    other_parties = [p for p in parties if p not in party_order]
+    ordered_parties = [p for p in PARTY_ORDER if p in parties]
+    other_parties = [p for p in parties if p not in PARTY_ORDER]
     if other_parties:
         df["partyid"] = df["partyid"].apply(lambda value: "Other" if value in other_parties else value)
         ordered_parties.append("Other")
     parties = ordered_parties
 
-    threshold_counts = {period: {} for period in periods}
+    threshold_counts = {period: {} for period in PERIODS}
 
-    for period in periods:
+    for period in PERIODS:
         period_df = df[df["period"] == period]
         period_wordsum = period_df["wordsum"].dropna()
         mean = period_wordsum.mean()
         std = period_wordsum.std()
         threshold = mean + 2 * std
-        print(
-            f"{period} population wordsum mean={mean:.4f}, std={std:.4f}, threshold={threshold:.4f}"
+        report.add(
+            PopulationThreshold(report.name, period, mean, std, threshold, threshold > 10)
         )
-        if threshold > 10:
-            print(f"{period} threshold exceeds 10; treating wordsum == 10 as meeting it.")
 
-        print(f"Period {period} wordsum stats by party:")
         for party in parties:
             subset = period_df[period_df["partyid"] == party]["wordsum"].dropna()
             if subset.empty:
                 continue
-            print(f"Party {party}: {summarize(subset)}")
+            report.add(GroupSummary.from_series(report.name, period, party, subset))
 
         if stats is None:
             print("scipy is not installed; skipping t-tests.")
         else:
-            print(f"T-tests for period {period}:")
             party_groups = {
                 party: period_df[period_df["partyid"] == party]["wordsum"].dropna()
                 for party in parties
@@ -107,9 +59,17 @@ def main() -> None:
                 t_stat, p_value = stats.ttest_ind(
                     party_groups[left], party_groups[right], equal_var=False, nan_policy="omit"
                 )
-                print(
-                    f"{left} vs {right}: t={t_stat:.4f}, p={p_value:.4g}, "
-                    f"n1={len(party_groups[left])}, n2={len(party_groups[right])}"
+                report.add(
+                    TTestResult(
+                        report.name,
+                        period,
+                        left,
+                        right,
+                        t_stat,
+                        p_value,
+                        len(party_groups[left]),
+                        len(party_groups[right]),
+                    )
                 )
 
         period_counts = {}
@@ -121,7 +81,10 @@ def main() -> None:
                 meets_threshold = party_values > threshold
             period_counts[party] = int(meets_threshold.sum())
         threshold_counts[period] = period_counts
-        print(f"{period} counts above 2-sigma: {period_counts}")
+        report.extend(
+            ThresholdCount(report.name, period, party, count)
+            for party, count in period_counts.items()
+        )
 
         if parties:
             cols = 3
@@ -136,7 +99,7 @@ def main() -> None:
                     subset,
                     bins=range(1, 11),
                     edgecolor="black",
-                    color=party_colors.get(party),
+                    color=PARTY_COLORS.get(party),
                 )
                 ax.set_title(str(party))
                 ax.set_xlabel("wordsum")
@@ -150,7 +113,7 @@ def main() -> None:
     bar_width = 0.35
     pre_counts = [threshold_counts["Pre-Trump"].get(party, 0) for party in parties]
     post_counts = [threshold_counts["Post-Trump"].get(party, 0) for party in parties]
-    bar_colors = [party_colors.get(party, "#CCCCCC") for party in parties]
+    bar_colors = [PARTY_COLORS.get(party, "#CCCCCC") for party in parties]
     ax2.bar(
         [x - bar_width / 2 for x in x_positions],
         pre_counts,
@@ -201,6 +164,8 @@ def main() -> None:
         )
         ax4.set_title("Post-Trump: 2-sigma exceeders by party")
 
+    report.write()
+
     plt.tight_layout()
     plt.show()
 
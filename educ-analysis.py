@@ -1,23 +1,31 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from report import CategoryShare, Report
+
 
 def main() -> None:
     df = pd.read_excel("simple-educ-data.xlsx")
     df["educ"] = df["educ"].astype(str)
 
+    report = Report("education")
+    years = pd.to_numeric(df["year"], errors="coerce").dropna().astype(int)
+    scope = f"{years.min()}-{years.max()}"
+
     parties = ["D", "R", "I"]
     for party in parties:
         subset = df[df["partyid"] == party]["educ"].dropna()
-        print(f"Party {party} education distribution (count={len(subset)}):")
         counts = subset.value_counts()
         percents = (counts / counts.sum() * 100).round(2)
-        summary = pd.DataFrame({"count": counts, "percent": percents})
-        print(summary)
+        report.extend(
+            CategoryShare(report.name, scope, party, category, int(count), percents[category])
+            for category, count in counts.items()
+        )
 
     top_categories = df["educ"].value_counts().head(10).index.tolist()
     if not top_categories:
         print("No education categories available to plot.")
+        report.write()
         return
 
     x_positions = range(len(top_categories))
@@ -42,6 +50,8 @@ def main() -> None:
     ax.set_title("Top education categories by party (simple labels)")
     ax.legend(title="Party")
 
+    report.write()
+
     plt.tight_layout()
     plt.show()
 
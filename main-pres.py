@@ -1,25 +1,14 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from report import GroupSummary, PopulationThreshold, Report, TTestResult, ThresholdCount
+
 try:
     from scipy import stats
 except ImportError:  # pragma: no cover - optional dependency for t-tests
     stats = None
 
 
-def summarize(series: pd.Series) -> dict:
-    return {
-        "count": int(series.count()),
-        "mean": series.mean(),
-        "median": series.median(),
-        "std": series.std(),
-        "min": series.min(),
-        "25%": series.quantile(0.25),
-        "75%": series.quantile(0.75),
-        "max": series.max(),
-    }
-
-
 def build_election_data(
     df: pd.DataFrame, label: str, column: str, candidates: list[str], years: list[int]
 ) -> pd.DataFrame:
@@ -36,6 +25,7 @@ def main() -> None:
     df["year"] = pd.to_numeric(df["year"], errors="coerce")
     df["wordsum"] = pd.to_numeric(df["wordsum"], errors="coerce")
     df = df[df["wordsum"].between(1, 10, inclusive="both")]
+    report = Report("presidential")
 
     election_configs = [
         {
@@ -95,19 +85,17 @@ def main() -> None:
         mean = period_wordsum.mean()
         std = period_wordsum.std()
         threshold = mean + 2 * std
-        print(
-            f"{election_label} population wordsum mean={mean:.4f}, std={std:.4f}, "
-            f"threshold={threshold:.4f}"
-        )
-        if threshold > 10:
-            print(
-                f"{election_label} threshold exceeds 10; treating wordsum == 10 as meeting it."
+        report.add(
+            PopulationThreshold(
+                report.name, election_label, mean, std, threshold, threshold > 10
             )
+        )
 
-        print(f"{election_label} wordsum stats by voter:")
         for col_idx, candidate in enumerate(candidates):
             subset = election_df[election_df["voter"] == candidate]["wordsum"].dropna()
-            print(f"Voter {candidate}: {summarize(subset)}")
+            report.add(
+                GroupSummary.from_series(report.name, election_label, candidate, subset)
+            )
             ax = axes[row_idx][col_idx]
             ax.hist(subset, bins=range(1, 11), edgecolor="black")
             ax.set_title(f"{election_label} - {candidate}")
@@ -128,10 +116,17 @@ def main() -> None:
                     equal_var=False,
                     nan_policy="omit",
                 )
-                print(
-                    f"T-test for {election_label}: {candidates[0]} vs {candidates[1]} "
-                    f"t={t_stat:.4f}, p={p_value:.4g}, "
-                    f"n1={len(groups[candidates[0]])}, n2={len(groups[candidates[1]])}"
+                report.add(
+                    TTestResult(
+                        report.name,
+                        election_label,
+                        candidates[0],
+                        candidates[1],
+                        t_stat,
+                        p_value,
+                        len(groups[candidates[0]]),
+                        len(groups[candidates[1]]),
+                    )
                 )
             else:
                 print(f"Insufficient data for t-test in {election_label}.")
@@ -147,7 +142,10 @@ def main() -> None:
                 meets_threshold = candidate_values > threshold
             election_counts[candidate] = int(meets_threshold.sum())
         threshold_counts[election_label] = election_counts
-        print(f"{election_label} counts above 2-sigma: {election_counts}")
+        report.extend(
+            ThresholdCount(report.name, election_label, candidate, count)
+            for candidate, count in election_counts.items()
+        )
 
         fig_bar, ax_bar = plt.subplots(figsize=(6, 4))
         ax_bar.bar(list(election_counts.keys()), list(election_counts.values()))
@@ -169,6 +167,8 @@ def main() -> None:
             )
             ax_pie.set_title(f"{election_label}: 2-sigma exceeders by voter")
 
+    report.write()
+
     plt.tight_layout()
     plt.show()
 
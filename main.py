@@ -1,6 +1,8 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from report import GroupSummary, PopulationThreshold, Report, TTestResult, ThresholdCount
+
 try:
     from scipy import stats
 except ImportError:  # pragma: no cover - optional dependency for t-tests
@@ -9,6 +11,7 @@ except ImportError:  # pragma: no cover - optional dependency for t-tests
 def main() -> None:
     df = pd.read_excel("simple-data.xlsx")
     df["wordsum"] = pd.to_numeric(df["wordsum"], errors="coerce")
+    report = Report("wordsum")
 
     period_map = {
         2010: "Pre-Trump",
@@ -27,18 +30,7 @@ def main() -> None:
         for col_idx, party in enumerate(parties):
             ax = axes[row_idx, col_idx]
             subset = df[(df["period"] == period) & (df["partyid"] == party)]["wordsum"].dropna()
-            print(f"Period {period} Party {party} wordsum stats:")
-            summary = {
-                "count": int(subset.count()),
-                "mean": subset.mean(),
-                "median": subset.median(),
-                "std": subset.std(),
-                "min": subset.min(),
-                "25%": subset.quantile(0.25),
-                "75%": subset.quantile(0.75),
-                "max": subset.max(),
-            }
-            print(summary)
+            report.add(GroupSummary.from_series(report.name, period, party, subset))
             ax.hist(subset, bins=range(1, 11), edgecolor="black")
             ax.set_title(f"{period} - {party}")
             ax.set_xlabel("wordsum")
@@ -48,7 +40,6 @@ def main() -> None:
         print("scipy is not installed; skipping t-tests.")
     else:
         for period in periods:
-            print(f"T-tests for period {period}:")
             period_df = df[df["period"] == period]
             groups = {
                 party: period_df[period_df["partyid"] == party]["wordsum"].dropna()
@@ -58,9 +49,17 @@ def main() -> None:
                 t_stat, p_value = stats.ttest_ind(
                     groups[left], groups[right], equal_var=False, nan_policy="omit"
                 )
-                print(
-                    f"{left} vs {right}: t={t_stat:.4f}, p={p_value:.4g}, "
-                    f"n1={len(groups[left])}, n2={len(groups[right])}"
+                report.add(
+                    TTestResult(
+                        report.name,
+                        period,
+                        left,
+                        right,
+                        t_stat,
+                        p_value,
+                        len(groups[left]),
+                        len(groups[right]),
+                    )
                 )
 
     threshold_counts = {}
@@ -69,9 +68,9 @@ def main() -> None:
         mean = period_wordsum.mean()
         std = period_wordsum.std()
         threshold = mean + 2 * std
-        print(f"{period} population wordsum mean={mean:.4f}, std={std:.4f}, threshold={threshold:.4f}")
-        if threshold > 10:
-            print(f"{period} threshold exceeds 10; treating wordsum == 10 as meeting it.")
+        report.add(
+            PopulationThreshold(report.name, period, mean, std, threshold, threshold > 10)
+        )
         period_counts = {}
         for party in parties:
             party_values = df[
@@ -83,7 +82,10 @@ def main() -> None:
                 meets_threshold = party_values > threshold
             period_counts[party] = int(meets_threshold.sum())
         threshold_counts[period] = period_counts
-        print(f"{period} counts above 2-sigma: {period_counts}")
+        report.extend(
+            ThresholdCount(report.name, period, party, count)
+            for party, count in period_counts.items()
+        )
 
     fig2, ax2 = plt.subplots(figsize=(8, 4))
     bar_width = 0.35
@@ -136,6 +138,8 @@ def main() -> None:
         )
         ax4.set_title("Post-Trump: 2-sigma exceeders by party")
 
+    report.write()
+
     plt.tight_layout()
     plt.show()
 
@@ -0,0 +1,229 @@
+import html
+import json
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency for parquet output
+    pyarrow = None
+
+
+DEFAULT_FORMATS = ("csv", "parquet", "json", "xlsx", "html")
+
+
+@dataclass
+class GroupSummary:
+    analysis: str
+    scope: str
+    group: str
+    count: int
+    mean: float
+    median: float
+    std: float
+    min: float
+    p25: float
+    p75: float
+    max: float
+
+    table = "summaries"
+
+    @classmethod
+    def from_series(
+        cls, analysis: str, scope: str, group: str, series: pd.Series
+    ) -> "GroupSummary":
+        return cls(
+            analysis=analysis,
+            scope=scope,
+            group=str(group),
+            count=int(series.count()),
+            mean=series.mean(),
+            median=series.median(),
+            std=series.std(),
+            min=series.min(),
+            p25=series.quantile(0.25),
+            p75=series.quantile(0.75),
+            max=series.max(),
+        )
+
+
+@dataclass
+class PopulationThreshold:
+    analysis: str
+    scope: str
+    mean: float
+    std: float
+    threshold: float
+    capped: bool
+
+    table = "thresholds"
+
+
+@dataclass
+class TTestResult:
+    analysis: str
+    scope: str
+    left: str
+    right: str
+    t_stat: float
+    p_value: float
+    n1: int
+    n2: int
+
+    table = "t_tests"
+
+
+@dataclass
+class ThresholdCount:
+    analysis: str
+    scope: str
+    group: str
+    count: int
+
+    table = "threshold_counts"
+
+
+@dataclass
+class CategoryShare:
+    analysis: str
+    scope: str
+    group: str
+    category: str
+    count: int
+    percent: float
+
+    table = "category_shares"
+
+
+@dataclass
+class TrendPoint:
+    analysis: str
+    scope: str
+    group: str
+    year: int
+    window: int
+    waves_pooled: int
+    count: int
+    mean: float
+    ci_low: float
+    ci_high: float
+
+    table = "trend_points"
+
+
+@dataclass
+class TrendTest:
+    analysis: str
+    scope: str
+    group: str
+    years: int
+    slope: float
+    intercept: float
+    r_value: float
+    p_value: float
+    kendall_tau: float
+    kendall_p_value: float
+
+    table = "trend_tests"
+
+
+@dataclass
+class Changepoint:
+    analysis: str
+    scope: str
+    group: str
+    last_year_before: int
+    first_year_after: int
+    mean_before: float
+    mean_after: float
+    t_stat: float
+    permutation_p_value: float
+    permutations: int
+    n1: int
+    n2: int
+
+    table = "changepoints"
+
+
+class Report:
+    """Collects typed result records and writes them out in one pass."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._records: dict[str, list] = {}
+
+    def add(self, record) -> None:
+        self._records.setdefault(record.table, []).append(record)
+
+    def extend(self, records) -> None:
+        for record in records:
+            self.add(record)
+
+    def tables(self) -> dict[str, pd.DataFrame]:
+        frames = {}
+        for table, records in self._records.items():
+            columns = [field.name for field in fields(records[0])]
+            frames[table] = pd.DataFrame(
+                [asdict(record) for record in records], columns=columns
+            )
+        return frames
+
+    def write(self, output_dir: str = "reports", formats=DEFAULT_FORMATS) -> list[Path]:
+        tables = self.tables()
+        if not tables:
+            print(f"No results collected for {self.name}; nothing written.")
+            return []
+
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        written = []
+        written_formats = []
+
+        for fmt in formats:
+            if fmt == "csv":
+                for table, frame in tables.items():
+                    path = out / f"{self.name}-{table}.csv"
+                    frame.to_csv(path, index=False)
+                    written.append(path)
+            elif fmt == "parquet":
+                if pyarrow is None:
+                    print("pyarrow is not installed; skipping parquet output.")
+                    continue
+                for table, frame in tables.items():
+                    path = out / f"{self.name}-{table}.parquet"
+                    frame.to_parquet(path, index=False)
+                    written.append(path)
+            elif fmt == "json":
+                path = out / f"{self.name}.json"
+                payload = {
+                    table: json.loads(frame.to_json(orient="records"))
+                    for table, frame in tables.items()
+                }
+                path.write_text(json.dumps(payload, indent=2))
+                written.append(path)
+            elif fmt == "xlsx":
+                path = out / f"{self.name}.xlsx"
+                with pd.ExcelWriter(path) as writer:
+                    for table, frame in tables.items():
+                        frame.to_excel(writer, sheet_name=table, index=False)
+                written.append(path)
+            elif fmt == "html":
+                path = out / f"{self.name}.html"
+                sections = [
+                    f"<h2>{html.escape(table)}</h2>\n{frame.to_html(index=False, na_rep='')}"
+                    for table, frame in tables.items()
+                ]
+                title = html.escape(self.name)
+                path.write_text(
+                    f"<html><head><title>{title}</title></head><body>\n"
+                    f"<h1>{title}</h1>\n" + "\n".join(sections) + "\n</body></html>\n"
+                )
+                written.append(path)
+            else:
+                raise ValueError(f"Unsupported report format: {fmt}")
+            written_formats.append(fmt)
+
+        print(f"{self.name} report written to {out}/ ({', '.join(written_formats)})")
+        return written
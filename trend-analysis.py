@@ -0,0 +1,341 @@
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from data import PARTY_ALIASES, PARTY_COLORS, PARTY_ORDER, PERIOD_MAP, PERIODS, map_party_label
+from report import Changepoint, Report, TrendPoint, TrendTest
+
+try:
+    from scipy import stats
+except ImportError:  # pragma: no cover - optional dependency for CIs and trend tests
+    stats = None
+
+
+CLEAN_PATH = "clean-trend-data.xlsx"
+
+EDUC_BANDS = [
+    "Less than high school",
+    "High school",
+    "Some college",
+    "Bachelor's",
+    "Graduate",
+]
+
+
+def wave_sums(
+    years: np.ndarray, values: np.ndarray, waves: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    offsets = np.searchsorted(waves, years)
+    counts = np.bincount(offsets, minlength=len(waves)).astype(float)
+    sums = np.bincount(offsets, weights=values, minlength=len(waves))
+    squares = np.bincount(offsets, weights=values**2, minlength=len(waves))
+    return counts, sums, squares
+
+
+def cumulative(array: np.ndarray) -> np.ndarray:
+    return np.concatenate([[0.0], np.cumsum(array)])
+
+
+def rolling_stats(
+    counts: np.ndarray, sums: np.ndarray, squares: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # The window counts survey waves (the GSS was annual until 1994 and
+    # biennial after), centered on each wave and truncated at the ends; an
+    # even window takes the extra wave after the centre. Each window is a
+    # difference of two cumulative sums, so any window size costs O(waves).
+    # The first array is the number of waves actually pooled.
+    cum_counts, cum_sums, cum_squares = cumulative(counts), cumulative(sums), cumulative(squares)
+    centre = np.arange(len(counts))
+    lo = np.clip(centre - (window - 1) // 2, 0, len(counts))
+    hi = np.clip(centre + window // 2 + 1, 0, len(counts))
+    n = cum_counts[hi] - cum_counts[lo]
+    total = cum_sums[hi] - cum_sums[lo]
+    total_sq = cum_squares[hi] - cum_squares[lo]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(n > 0, total / n, np.nan)
+        var = np.where(n > 1, (total_sq - total * mean) / (n - 1), np.nan)
+        se = np.sqrt(np.clip(var, 0, None) / n)
+        if stats is None:
+            critical = 1.96
+        else:
+            critical = stats.t.ppf(0.975, np.where(n > 1, n - 1, np.nan))
+    return hi - lo, n, mean, mean - critical * se, mean + critical * se
+
+
+def split_sse(
+    cum_counts: np.ndarray, cum_sums: np.ndarray, cum_squares: np.ndarray, k: np.ndarray
+) -> np.ndarray:
+    n1, s1, ss1 = cum_counts[k], cum_sums[k], cum_squares[k]
+    n2, s2, ss2 = cum_counts[-1] - n1, cum_sums[-1] - s1, cum_squares[-1] - ss1
+    return (ss1 - s1**2 / n1) + (ss2 - s2**2 / n2)
+
+
+def find_changepoint(
+    years: np.ndarray,
+    values: np.ndarray,
+    waves: np.ndarray,
+    permutations: int,
+    rng: np.random.Generator,
+) -> tuple[int, int, float, float, float, float, int, int] | None:
+    # Single mean-shift split minimizing the pooled within-segment sum of
+    # squares. Respondents are sorted by wave, so the wave-level cumulative
+    # sums are the respondent-level ones read at the wave boundaries.
+    # Because the split is picked from the data, significance comes from a
+    # max-statistic permutation test: shuffle wordsum across respondents,
+    # redo the same search, and count how often the best shuffled split fits
+    # at least as well as the observed one.
+    order = np.argsort(years, kind="stable")
+    values = values[order]
+    counts = np.bincount(np.searchsorted(waves, years), minlength=len(waves))
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    candidates = np.array(
+        [
+            k
+            for k in range(1, len(counts))
+            if counts[k] > 0 and bounds[k] > 1 and bounds[-1] - bounds[k] > 1
+        ],
+        dtype=int,
+    )
+    if not len(candidates):
+        return None
+
+    cum_counts = bounds.astype(float)
+    cum_sums = cumulative(values)[bounds]
+    cum_squares = cumulative(values**2)[bounds]
+    sse = split_sse(cum_counts, cum_sums, cum_squares, candidates)
+    best = int(np.argmin(sse))
+    after = int(candidates[best])
+    before = int(np.flatnonzero(counts[:after])[-1])
+
+    exceed = 0
+    for _ in range(permutations):
+        shuffled = rng.permutation(values)
+        null_sse = split_sse(
+            cum_counts,
+            cumulative(shuffled)[bounds],
+            cumulative(shuffled**2)[bounds],
+            candidates,
+        )
+        exceed += null_sse.min() <= sse[best]
+    p_value = (exceed + 1) / (permutations + 1)
+
+    n1, s1, ss1 = cum_counts[after], cum_sums[after], cum_squares[after]
+    n2, s2, ss2 = cum_counts[-1] - n1, cum_sums[-1] - s1, cum_squares[-1] - ss1
+    mean1, mean2 = s1 / n1, s2 / n2
+    var1 = max((ss1 - s1 * mean1) / (n1 - 1), 0)
+    var2 = max((ss2 - s2 * mean2) / (n2 - 1), 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_stat = (mean1 - mean2) / np.sqrt(var1 / n1 + var2 / n2)
+    return before, after, mean1, mean2, t_stat, p_value, int(n1), int(n2)
+
+
+def educ_years(value) -> float:
+    # Data Explorer extracts label educ ("12th grade", "3 years of college");
+    # the cumulative file stores it as completed years 0-20.
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized == "no formal schooling":
+            return 0
+        grade = re.fullmatch(r"(\d+)(?:st|nd|rd|th) grade", normalized)
+        if grade:
+            return int(grade.group(1))
+        college = re.fullmatch(r"(\d+)(?: or more)? years? of college", normalized)
+        if college:
+            return 12 + int(college.group(1))
+    return pd.to_numeric(value, errors="coerce")
+
+
+def map_educ_band(value) -> str | None:
+    years = educ_years(value)
+    if pd.isna(years) or not 0 <= years <= 20:
+        return None
+    if years < 12:
+        return "Less than high school"
+    if years == 12:
+        return "High school"
+    if years < 16:
+        return "Some college"
+    if years == 16:
+        return "Bachelor's"
+    return "Graduate"
+
+
+def era_boundary() -> float:
+    last_before = max(year for year, period in PERIOD_MAP.items() if period == PERIODS[0])
+    first_after = min(year for year, period in PERIOD_MAP.items() if period == PERIODS[1])
+    return (last_before + first_after) / 2
+
+
+def main(window: int = 5, permutations: int = 999) -> None:
+    if window < 1:
+        raise ValueError(f"window must be at least one survey wave, got {window}")
+    if not Path(CLEAN_PATH).exists():
+        raise SystemExit(
+            f"{CLEAN_PATH} not found. Save the GSS 1972-2024 extract (year, partyid, "
+            "educ, wordsum) as trend-data.xlsx and run trend-data.py to produce it."
+        )
+
+    df = pd.read_excel(CLEAN_PATH)
+    df["year"] = df["year"].astype(int)
+    df["wordsum"] = pd.to_numeric(df["wordsum"], errors="coerce")
+    report = Report("wordsum-trend")
+
+    df["party7"] = df["partyid"].replace(PARTY_ALIASES)
+    df["party7"] = df["party7"].apply(
+        lambda value: value if value in PARTY_ORDER else "Other"
+    )
+    df["party3"] = df["partyid"].apply(map_party_label)
+    df["educ_band"] = df["educ"].apply(map_educ_band)
+
+    groupings = [
+        {
+            "label": "7-point party",
+            "column": "party7",
+            "groups": PARTY_ORDER,
+            "colors": PARTY_COLORS,
+        },
+        {
+            "label": "3-way party",
+            "column": "party3",
+            "groups": ["D", "R", "I"],
+            "colors": {"D": "#0B3D91", "R": "#8B0000", "I": "#BDBDBD"},
+        },
+        {
+            "label": "Education",
+            "column": "educ_band",
+            "groups": EDUC_BANDS,
+            "colors": {},
+        },
+    ]
+
+    waves = np.sort(df["year"].unique())
+    rng = np.random.default_rng(0)
+    boundary = era_boundary()
+
+    fig, axes = plt.subplots(
+        len(groupings), 1, figsize=(12, 4 * len(groupings)), sharex=True, sharey=True
+    )
+
+    for ax, grouping in zip(axes, groupings):
+        scope = grouping["label"]
+        grouped = df[df[grouping["column"]].isin(grouping["groups"])]
+        if grouped.empty:
+            print(f"No {scope} values recognised in {CLEAN_PATH}; skipping that panel.")
+            ax.text(0.5, 0.5, f"No {scope} data", ha="center", va="center")
+            ax.set_title(f"Wordsum by {scope}")
+            ax.axis("off")
+            continue
+
+        for group in grouping["groups"]:
+            subset = grouped[grouped[grouping["column"]] == group]
+            if subset.empty:
+                continue
+            counts, sums, squares = wave_sums(
+                subset["year"].to_numpy(), subset["wordsum"].to_numpy(float), waves
+            )
+            surveyed = counts > 0
+
+            rolling = {}
+            for size in sorted({1, window}):
+                rolling[size] = rolling_stats(counts, sums, squares, size)
+                pooled, n, mean, ci_low, ci_high = rolling[size]
+                report.extend(
+                    TrendPoint(
+                        report.name,
+                        scope,
+                        group,
+                        int(waves[idx]),
+                        size,
+                        int(pooled[idx]),
+                        int(n[idx]),
+                        mean[idx],
+                        ci_low[idx],
+                        ci_high[idx],
+                    )
+                    for idx in np.flatnonzero(surveyed)
+                )
+
+            yearly_mean = sums[surveyed] / counts[surveyed]
+            if stats is None:
+                print(f"scipy is not installed; skipping trend tests for {scope} {group}.")
+            elif surveyed.sum() >= 3:
+                fit = stats.linregress(waves[surveyed], yearly_mean)
+                tau, tau_p = stats.kendalltau(waves[surveyed], yearly_mean)
+                report.add(
+                    TrendTest(
+                        report.name,
+                        scope,
+                        group,
+                        int(surveyed.sum()),
+                        fit.slope,
+                        fit.intercept,
+                        fit.rvalue,
+                        fit.pvalue,
+                        tau,
+                        tau_p,
+                    )
+                )
+
+            change = find_changepoint(
+                subset["year"].to_numpy(),
+                subset["wordsum"].to_numpy(float),
+                waves,
+                permutations,
+                rng,
+            )
+            if change is not None:
+                before, after, mean_before, mean_after, t_stat, p_value, n1, n2 = change
+                report.add(
+                    Changepoint(
+                        report.name,
+                        scope,
+                        group,
+                        int(waves[before]),
+                        int(waves[after]),
+                        mean_before,
+                        mean_after,
+                        t_stat,
+                        p_value,
+                        permutations,
+                        n1,
+                        n2,
+                    )
+                )
+
+            _, _, rolling_mean, rolling_low, rolling_high = rolling[window]
+            line = ax.plot(
+                waves[surveyed],
+                rolling_mean[surveyed],
+                label=str(group),
+                color=grouping["colors"].get(group),
+            )[0]
+            ax.fill_between(
+                waves[surveyed],
+                rolling_low[surveyed],
+                rolling_high[surveyed],
+                color=line.get_color(),
+                alpha=0.15,
+            )
+            ax.scatter(
+                waves[surveyed], yearly_mean, color=line.get_color(), s=8, alpha=0.4
+            )
+
+        ax.axvline(boundary, color="black", linestyle="--", linewidth=0.8)
+        ax.set_title(f"Wordsum by {scope} (centered {window}-wave rolling mean, 95% CI)")
+        ax.set_ylabel("wordsum")
+        ax.legend(fontsize="small", ncol=2)
+    axes[-1].set_xlabel("year")
+
+    report.write()
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
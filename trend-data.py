@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pandas as pd
+
+from data import is_invalid_cell
+
+
+RAW_PATH = "trend-data.xlsx"
+CLEAN_PATH = "clean-trend-data.xlsx"
+
+
+def main() -> None:
+    if not Path(RAW_PATH).exists():
+        raise SystemExit(
+            f"{RAW_PATH} not found. Export year, partyid, educ and wordsum for every "
+            "GSS year (1972-2024) from the GSS Data Explorer cumulative file and "
+            f"save it as {RAW_PATH}, then re-run this script."
+        )
+
+    df = pd.read_excel(RAW_PATH)
+    invalid_party_rows = df["partyid"].apply(is_invalid_cell)
+    cleaned = df.loc[~invalid_party_rows].copy()
+    cleaned["year"] = pd.to_numeric(cleaned["year"], errors="coerce")
+    cleaned = cleaned[cleaned["year"].notna()]
+    cleaned["wordsum"] = pd.to_numeric(cleaned["wordsum"], errors="coerce")
+    cleaned = cleaned[cleaned["wordsum"].between(0, 10, inclusive="both")]
+    # Invalid educ codes are kept; they only drop out of the education facet.
+    cleaned.to_excel(CLEAN_PATH, index=False)
+
+
+if __name__ == "__main__":
+    main()